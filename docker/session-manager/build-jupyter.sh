@@ -1,5 +1,7 @@
 #!/bin/bash
 
+docker buildx version >/dev/null 2>&1 && export DOCKER_BUILDKIT=1
+
 #echo "Building Jupyter session image"
 docker build -t visp-jupyter-session -f jupyter-session/Dockerfile .
 
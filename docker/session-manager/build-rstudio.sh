@@ -1,5 +1,7 @@
 #!/bin/bash
 
+docker buildx version >/dev/null 2>&1 && export DOCKER_BUILDKIT=1
+
 if  [! -f ./matlab_runtime/matlab_runtime_install.zip] 
 then
   echo "MATLAB Runtime not found, downloading..."
@@ -1,4 +1,4 @@
-cp -Rvp ../../container-agent/dist ./container-agent
+docker buildx version >/dev/null 2>&1 && export DOCKER_BUILDKIT=1
 
 echo "Building Operations session image"
 docker build --no-cache -t visp-operations-session -f operations-session/Dockerfile .
@@ -8,5 +8,3 @@ docker build --no-cache -t visp-rstudio-session -f rstudio-session/Dockerfile .
 
 echo "Building Jupyter session image"
 docker build --no-cache -t visp-jupyter-session -f jupyter-session/Dockerfile .
-
-rm -R ./container-agent
@@ -1,3 +1,5 @@
+docker buildx version >/dev/null 2>&1 && export DOCKER_BUILDKIT=1
+
 #echo "Building Operations session image"
 docker build -t visp-operations-session -f operations-session/Dockerfile .
 
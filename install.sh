@@ -46,33 +46,65 @@ echo "Generating local self-signed certificate for internal IdP"
 mkdir certs/ssp-idp-cert
 openssl req -x509 -newkey rsa:4096 -keyout certs/ssp-idp-cert/key.pem -out certs/ssp-idp-cert/cert.pem -nodes -days 3650 -subj "/C=SE/ST=visp/L=visp/O=visp/OU=visp/CN=visp.local"
 
-echo "Grabbing latest webclient"
-git clone https://github.com/humlab-speech/webclient
-
-echo "Grabbing latest webapi"
-git clone https://github.com/humlab-speech/webapi
+#waits for every given background job and only then fails if any of them did,
+#so an aborted install never leaves jobs running behind it
+wait_all() {
+    local failed=0
+    for pid in "$@"; do
+        wait "$pid" || failed=1
+    done
+    return $failed
+}
 
-echo "Grabbing latest container-agent"
-git clone https://github.com/humlab-speech/container-agent
-cd container-agent && npm install && npm run build && cd ..
+echo "Grabbing latest webclient, webapi, container-agent, wsrng-server and session-manager"
+#the clones are network-bound and independent, so run them concurrently
+#blobless partial clones keep the full commit history for development but only fetch file contents as they are needed
+clone_pids=()
+for repo in webclient webapi container-agent wsrng-server session-manager; do
+    git clone --filter=blob:none https://github.com/humlab-speech/$repo &
+    clone_pids+=($!)
+done
+wait_all "${clone_pids[@]}"
 
 echo "Grabbing emu-webapp-server .env file"
 mkdir -p mounts/emu-webapp-server/logs
 curl -L https://raw.githubusercontent.com/humlab-speech/emu-webapp-server/main/.env-example -o ./mounts/emu-webapp-server/.env
 
-echo "Installing Web Speech Recorder NG server"
-git clone https://github.com/humlab-speech/wsrng-server
-cd wsrng-server && npm install && mkdir logs && touch logs/wsrng-server.log && cd .. 
+#the component installs/builds are independent, so run them concurrently
+#each one runs in its own directory in the background, with its output prefixed by the component name
+build_pids=()
+build_component() {
+    local name=$1
+    local step=$2
+    (set -o pipefail; (cd "$name" && $step) 2>&1 | sed -u "s/^/[$name] /") &
+    build_pids+=($!)
+}
+
+#npm ci installs straight from the lockfile without resolving the dependency tree, so prefer it when there is one
+#--prefer-offline serves packages already in the shared ~/.npm cache without revalidating them against the registry
+npm_install() {
+    if [[ -f package-lock.json || -f npm-shrinkwrap.json ]]; then
+        npm ci --prefer-offline
+    else
+        echo "Warning: no lockfile found, falling back to npm install"
+        npm install --prefer-offline
+    fi
+}
 
-echo "Install & build container-agent"
-cd container-agent && npm install && npm run build && cd ..
+install_wsrng_server() {
+    npm_install && mkdir logs && touch logs/wsrng-server.log
+}
 
-echo "Install & build webclient"
-cd webclient && npm install && npm run build && cd ..
+install_and_build() {
+    npm_install && npm run build
+}
 
-echo "Install Session-Manager"
-git clone https://github.com/humlab-speech/session-manager
-cd session-manager && npm install && cd ..
+echo "Installing Web Speech Recorder NG server, container-agent, webclient and Session-Manager"
+build_component wsrng-server install_wsrng_server
+build_component container-agent install_and_build
+build_component webclient install_and_build
+build_component session-manager npm_install
+wait_all "${build_pids[@]}"
 
 echo "Installing SimpleSamlPhp"
 curl -L https://github.com/simplesamlphp/simplesamlphp/releases/download/v1.19.6/simplesamlphp-1.19.6.tar.gz --output simplesamlphp.tar.gz
@@ -81,16 +113,17 @@ mv simplesamlphp-1.19.6 ./mounts/simplesamlphp/
 cp -Rv simplesamlphp-visp/* ./mounts/simplesamlphp/simplesamlphp/
 
 echo "Setting directory permissions"
+#the trees are independent, so chown them concurrently
+#emu-webapp-server is left out on purpose
+chown_pids=()
+for dir in webclient certs container-agent webapi wsrng-server session-manager; do
+    chown -R 1000:1000 "$dir" &
+    chown_pids+=($!)
+done
+wait_all "${chown_pids[@]}"
+#runs last so its service-specific owners, e.g. www-data on certs/ssp-idp-cert, are not overwritten by the chown of certs above
 ./set_permissions.sh
 
-chown -R 1000:1000 webclient
-chown -R 1000:1000 certs
-chown -R 1000:1000 container-agent
-#chown -R 1000:1000 emu-webapp-server
-chown -R 1000:1000 webapi
-chown -R 1000:1000 wsrng-server
-chown -R 1000:1000 session-manager
-
 # Fill out .env to the extent that we can, with randomly generated passwords
 #!/bin/bash
 
@@ -104,7 +137,7 @@ declare -a keys_to_fill=("POSTGRES_PASSWORD" "TEST_USER_LOGIN_KEY" "VISP_API_ACC
 generate_random_string() {
   local len=$1
   # Generate random alphanumeric string (adjust the length as needed)
-  tr -dc 'A-Za-z0-9' </dev/urandom | head -c ${len} || true
+  LC_ALL=C tr -dc 'A-Za-z0-9' </dev/urandom | head -c ${len} || true
 }
 
 # Check if the .env file exists
@@ -113,21 +146,40 @@ if [[ ! -f "$env_file" ]]; then
   exit 1
 fi
 
-# Read each line from the .env file
-while IFS= read -r line; do
-  # Extract the key name from the line
-  key=$(echo $line | cut -d '=' -f 1)
+# Write the filled out file next to the original and swap it in once at the end,
+# instead of rewriting the whole file with sed for every key
+tmp_env_file=$(mktemp "${env_file}.XXXXXX")
+chmod --reference="$env_file" "$tmp_env_file"
+
+# Draw the random characters for all keys with a single read of /dev/urandom and hand out slices of it
+secret_len=16
+random_pool=$(generate_random_string $((secret_len * ${#keys_to_fill[@]})))
+pool_offset=0
+
+# Read the whole .env file in one go and fill in its lines in memory
+mapfile -t env_lines < "$env_file"
+for i in "${!env_lines[@]}"; do
+  line=${env_lines[i]}
+  # Extract the key name from the line (parameter expansion, no subshell per line)
+  key=${line%%=*}
   
   # Check if the key is in the array of keys to fill
   if [[ " ${keys_to_fill[@]} " =~ " ${key} " && "$line" =~ =$ ]]; then
-    # Generate a random alphanumeric string for the value (e.g., 16 characters long)
-    random_value=$(generate_random_string 16)
+    # Take the next random alphanumeric string from the pool, topping it up if a key shows up more than once
+    if (( pool_offset + secret_len > ${#random_pool} )); then
+      random_pool+=$(generate_random_string $secret_len)
+    fi
+    random_value=${random_pool:pool_offset:secret_len}
+    pool_offset=$((pool_offset + secret_len))
     # Append the random value to the line
-    new_line="${key}=${random_value}"
-    # Replace the line in the file
-    sed -i "s|${line}|${new_line}|g" "$env_file"
+    env_lines[i]="${key}=${random_value}"
   fi
-done < "$env_file"
+done
+
+# Write out all lines with a single printf
+printf '%s\n' "${env_lines[@]}" > "$tmp_env_file"
+
+mv "$tmp_env_file" "$env_file"
 
 
 echo 
@@ -137,6 +189,14 @@ echo "Meanwhile I will build the session-manager container images, which will ta
 read -p "Press enter to continue: "
 
 
+#BuildKit only sends the files a Dockerfile actually uses from the build context and builds independent stages concurrently
+#the session images still have to be built in order, rstudio builds FROM operations and jupyter copies from both
+#docker 23 and later refuse DOCKER_BUILDKIT=1 when the buildx component is missing, so only enable it when buildx is there
+if docker buildx version >/dev/null 2>&1; then
+    export DOCKER_BUILDKIT=1
+    export COMPOSE_DOCKER_CLI_BUILD=1
+fi
+
 echo "Building Operations session image"
 docker build -t visp-operations-session -f ./docker/session-manager/operations-session/Dockerfile ./docker/session-manager/operations-session
 
@@ -146,6 +206,7 @@ docker build -t visp-rstudio-session -f ./docker/session-manager/rstudio-session
 #echo "Building Jupyter session image"
 docker build -t visp-jupyter-session -f ./docker/session-manager/jupyter-session/Dockerfile ./docker/session-manager/jupyter-session
 
-docker-compose build
+#the compose service images do not depend on each other
+docker-compose build --parallel
 
 echo "Development install complete. If everything above looks ok, you should now be able to run the project with 'docker-compose up -d'"